@@ -46,12 +46,13 @@ class MABCMeta(ABCMeta):
                 return instance
 
             # Create new instance
+            # Forwarding the resolved handle avoids re-deriving it inside the wrapper!
             #
-            instance = super(MABCMeta, cls).__call__(obj, **kwargs)
+            instance = super(MABCMeta, cls).__call__(handle, **kwargs)
 
             if instance is not None:
 
-                instance.__post_init__(obj, **kwargs)
+                instance.__post_init__(handle, **kwargs)
                 cls.__instances__[instance.hashCode()] = instance
 
             return instance
@@ -13,6 +13,9 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+__api_function_sets__ = tuple(dagutils.iterFunctionSets())  # Enumerated once since the set of MFn classes is fixed at import time!
+
+
 class MObjectWrapper(object, metaclass=mabcmeta.MABCMeta):
     """
     Abstract base class used as a low-level wrapper for Maya scene objects.
@@ -38,8 +41,24 @@ class MObjectWrapper(object, metaclass=mabcmeta.MABCMeta):
         super(MObjectWrapper, self).__init__()
 
         # Declare private variables
+        # An identity-first isinstance chain keeps the common types off the generic lookup path!
         #
-        self.__handle__ = dagutils.getMObjectHandle(obj)
+        if isinstance(obj, om.MObjectHandle):
+
+            self.__handle__ = obj
+
+        elif isinstance(obj, om.MObject):
+
+            self.__handle__ = om.MObjectHandle(obj)
+
+        elif isinstance(obj, om.MDagPath):
+
+            self.__handle__ = om.MObjectHandle(obj.node())
+
+        else:
+
+            self.__handle__ = dagutils.getMObjectHandle(obj)
+
         self.__function_set__ = self.findCompatibleFunctionSet(self.object())
 
     def __post_init__(self, *args, **kwargs):
@@ -291,7 +310,7 @@ class MObjectWrapper(object, metaclass=mabcmeta.MABCMeta):
 
         # Collect function sets and sort by inheritance depth
         #
-        functionSets = [x for x in dagutils.iterFunctionSets() if x().hasObj(dependNode)]
+        functionSets = [x for x in __api_function_sets__ if x().hasObj(dependNode)]
         functionSets.sort(key=lambda x: len(inspect.getmro(x)))
 
         functionSet = functionSets[-1]
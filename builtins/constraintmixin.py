@@ -4,7 +4,7 @@ from maya import cmds as mc
 from maya.api import OpenMaya as om
 from abc import abstractmethod
 from dcc.python import stringutils
-from dcc.maya.libs import transformutils, plugutils, plugmutators
+from dcc.maya.libs import plugutils, plugmutators
 from dcc.maya.decorators import animate
 from . import transformmixin
 from .. import mpyattribute
@@ -354,38 +354,35 @@ class ConstraintMixin(transformmixin.TransformMixin):
         """
 
         # Check if constraint has rest translate
+        # Accumulating onto one transformation matrix avoids two 4x4 multiplies and the intermediate matrices!
         #
-        translateMatrix = om.MMatrix.kIdentity
+        transformationMatrix = om.MTransformationMatrix()
 
         if self.hasAttr('restTranslate'):
 
             restTranslate = self.getAttr('restTranslate')
-            translateMatrix = transformutils.createTranslateMatrix(restTranslate)
+            transformationMatrix.setTranslation(om.MVector(restTranslate), om.MSpace.kTransform)
 
         # Check if constraint has rest rotate
         #
-        rotateMatrix = om.MMatrix.kIdentity
-
         if self.hasAttr('restRotate'):
 
             restAngles = list(map(math.radians, self.getAttr('restRotate')))
             restOrder = self.getAttr('constraintRotateOrder')
             restEulerRotation = om.MEulerRotation(restAngles, order=restOrder)
 
-            rotateMatrix = restEulerRotation.asMatrix()
+            transformationMatrix.setRotation(restEulerRotation)
 
         # Check if constraint has rest scale
         #
-        scaleMatrix = om.MMatrix.kIdentity
-
         if self.hasAttr('restScale'):
 
             restScale = self.getAttr('restScale')
-            scaleMatrix = transformutils.createScaleMatrix(restScale)
+            transformationMatrix.setScale(restScale, om.MSpace.kTransform)
 
         # Compose rest matrix
         #
-        return scaleMatrix * rotateMatrix * translateMatrix
+        return transformationMatrix.asMatrix()
 
     @animate.Animate(state=False)
     def setRestMatrix(self, restMatrix):
@@ -397,8 +394,13 @@ class ConstraintMixin(transformmixin.TransformMixin):
         """
 
         # Decompose rest matrix
+        # Going through the quaternion avoids rebuilding intermediate rotation matrices!
         #
-        translate, eulerRotation, scale = transformutils.decomposeTransformMatrix(restMatrix)
+        transformationMatrix = om.MTransformationMatrix(restMatrix)
+
+        translate = transformationMatrix.translation(om.MSpace.kTransform)
+        eulerRotation = transformationMatrix.rotation(asQuaternion=True).asEulerRotation()
+        scale = transformationMatrix.scale(om.MSpace.kTransform)
 
         # Check if constraint has rest translate
         #
@@ -127,11 +127,21 @@ class DagMixin(containerbasemixin.ContainerBaseMixin):
     def dagPath(self):
         """
         Returns a dag path to this object.
+        The resolved path is cached and reused for as long as it still points at this object!
 
         :rtype: om.MDagPath
         """
 
-        return om.MDagPath.getAPathTo(self.object())
+        dagPath = getattr(self, '__dag_path__', None)
+
+        if dagPath is not None and dagPath.isValid() and dagPath.node() == self.object():
+
+            return dagPath
+
+        dagPath = om.MDagPath.getAPathTo(self.object())
+        self.__dag_path__ = dagPath
+
+        return dagPath
 
     def instanceNumber(self):
         """
@@ -453,7 +463,19 @@ class DagMixin(containerbasemixin.ContainerBaseMixin):
         :rtype: Iterator[DagMixin]
         """
 
-        return map(self.scene.__call__, dagutils.iterChildren(self.dagPath(), apiType=apiType))
+        # Iterate through children
+        # Reading children off the dag path skips the function-set construction entirely!
+        #
+        dagPath = self.dagPath()
+        childCount = dagPath.childCount()
+
+        for i in range(childCount):
+
+            child = dagPath.child(i)
+
+            if child.hasFn(apiType):
+
+                yield self.scene(child)
 
     def children(self, apiType=om.MFn.kDagNode):
         """
@@ -513,7 +535,23 @@ class DagMixin(containerbasemixin.ContainerBaseMixin):
 
             yield self
 
-        yield from map(self.scene.__call__, dagutils.iterDescendants(self.object(), apiType=apiType))
+        # Walk the subtree using Maya's native iterator
+        # This keeps the breadth-first traversal and type filtering in C++!
+        #
+        rootNode = self.object()
+
+        iterator = om.MItDag(om.MItDag.kBreadthFirst, apiType)
+        iterator.reset(rootNode, om.MItDag.kBreadthFirst, apiType)
+
+        while not iterator.isDone():
+
+            currentNode = iterator.currentItem()
+
+            if currentNode != rootNode:
+
+                yield self.scene(currentNode)
+
+            iterator.next()
 
     def descendants(self, apiType=om.MFn.kDagNode, includeSelf=False):
         """
@@ -535,13 +573,27 @@ class DagMixin(containerbasemixin.ContainerBaseMixin):
         :rtype: Iterator[mpy.builtins.shapemixin.ShapeMixin]
         """
 
-        for shape in self.iterChildren(apiType=apiType):
+        # Iterate through child shapes
+        # A single reused function set avoids wrapping children that get filtered out!
+        #
+        dagPath = self.dagPath()
+        childCount = dagPath.childCount()
+
+        fnDagNode = om.MFnDagNode()
+
+        for i in range(childCount):
+
+            child = dagPath.child(i)
+
+            if not child.hasFn(apiType):
+
+                continue
 
-            isIntermediateObject = bool(shape.isIntermediateObject)
+            fnDagNode.setObject(child)
 
-            if (not intermediateObjects and not isIntermediateObject) or (intermediateObjects and isIntermediateObject):
+            if bool(fnDagNode.isIntermediateObject) == intermediateObjects:
 
-                yield shape
+                yield self.scene(child)
 
             else:
 
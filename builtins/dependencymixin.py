@@ -202,7 +202,24 @@ class DependencyMixin(mpynode.MPyNode):
         :rtype: str
         """
 
-        return dagutils.getNodeName(self.object(), includeNamespace=includeNamespace, includePath=includePath)
+        # Check if path should be included
+        #
+        if includePath:
+
+            return self.fullPathName()
+
+        # Check if namespace should be included
+        # rpartition avoids the intermediate segment lists that split allocates!
+        #
+        name = self.functionSet().name()
+
+        if includeNamespace:
+
+            return name
+
+        else:
+
+            return name.rpartition('|')[2].rpartition(':')[2]
 
     def setName(self, newName):
         """
@@ -386,14 +403,16 @@ class DependencyMixin(mpynode.MPyNode):
 
         # Check if node is referenced
         #
-        if self.isFromReferencedFile:
-
-            return self.scene(dagutils.getAssociatedReferenceNode(self.object()))
-
-        else:
+        if not self.isFromReferencedFile:
 
             return None
 
+        # Resolve the owning reference node directly
+        # This avoids probing every reference node in the scene per query!
+        #
+        referenceName = mc.referenceQuery(self.fullPathName(), referenceNode=True)
+        return self.scene(referenceName)
+
     def getOppositeNode(self):
         """
         Finds the node opposite to this one.
@@ -411,12 +430,16 @@ class DependencyMixin(mpynode.MPyNode):
         absoluteName = f'{self.namespace()}:{mirrorName}'
 
         # Check if opposite node exists
+        # Resolving the name directly avoids an extra command-engine round trip!
         #
-        if mc.objExists(absoluteName):
+        try:
 
-            return self.scene(absoluteName)
+            selection = om.MSelectionList()
+            selection.add(absoluteName)
 
-        else:
+            return self.scene(selection.getDependNode(0))
+
+        except RuntimeError:
 
             return self
 
@@ -1280,6 +1303,55 @@ class DependencyMixin(mpynode.MPyNode):
         #
         plugutils.removeMultiInstances(plug, indices)
 
+    def iterDependencies(self, apiType=om.MFn.kDependencyNode, typeName=None, direction=om.MItDependencyGraph.kDownstream):
+        """
+        Returns a generator that yields dependencies based on the supplied arguments.
+        The graph is walked with Maya's native iterator so the api-type filtering stays in C++!
+
+        :type apiType: int
+        :type typeName: Union[str, None]
+        :type direction: int
+        :rtype: Iterator[DependencyMixin]
+        """
+
+        # Iterate through dependency graph
+        #
+        rootNode = self.object()
+
+        iterator = om.MItDependencyGraph(
+            rootNode,
+            filter=apiType,
+            direction=direction,
+            traversal=om.MItDependencyGraph.kDepthFirst,
+            level=om.MItDependencyGraph.kNodeLevel
+        )
+
+        filterByTypeName = not stringutils.isNullOrEmpty(typeName)
+        fnDependNode = om.MFnDependencyNode()
+
+        while not iterator.isDone():
+
+            # Skip the root node and any type-name mismatches
+            #
+            currentNode = iterator.currentNode()
+
+            if currentNode == rootNode:
+
+                iterator.next()
+                continue
+
+            if filterByTypeName:
+
+                fnDependNode.setObject(currentNode)
+
+                if fnDependNode.typeName != typeName:
+
+                    iterator.next()
+                    continue
+
+            yield self.scene(currentNode)
+            iterator.next()
+
     def dependsOn(self, apiType=om.MFn.kDependencyNode, typeName=None):
         """
         Returns a list of nodes that this object is dependent on.
@@ -1289,7 +1361,7 @@ class DependencyMixin(mpynode.MPyNode):
         :rtype: List[DependencyMixin]
         """
 
-        return list(map(self.scene.__call__, dagutils.iterDependencies(self.object(), apiType, typeName=typeName, direction=om.MItDependencyGraph.kUpstream)))
+        return list(self.iterDependencies(apiType=apiType, typeName=typeName, direction=om.MItDependencyGraph.kUpstream))
 
     def dependents(self, apiType=om.MFn.kDependencyNode, typeName=''):
         """
@@ -1300,5 +1372,5 @@ class DependencyMixin(mpynode.MPyNode):
         :return: List[DependencyMixin]
         """
 
-        return list(map(self.scene.__call__, dagutils.iterDependencies(self.object(), apiType, typeName=typeName, direction=om.MItDependencyGraph.kDownstream)))
+        return list(self.iterDependencies(apiType=apiType, typeName=typeName, direction=om.MItDependencyGraph.kDownstream))
     # endregion
@@ -186,22 +186,31 @@ class HyperLayoutMixin(dependencymixin.DependencyMixin):
         :rtype: None
         """
 
-        # Iterate through members
+        # Collect members that are still alive
         #
-        members = list(self.iterMembers())
+        members = [member for member in self.iterMembers() if member.isAlive()]
+        numMembers = len(members)
 
-        for member in reversed(members):
+        if numMembers == 0:
 
-            # Check if member is still alive
-            #
-            if member.isAlive():
+            return
 
-                member.delete()
+        # Delete members through a single modifier stack
+        # Each delete is executed immediately since deleting one member can cascade into another,
+        # but reusing the modifier still avoids a per-member allocation!
+        #
+        hasDagNodes = any(member.hasFn(om.MFn.kDagNode) for member in members)
+        modifier = om.MDagModifier() if hasDagNodes else om.MDGModifier()
 
-            else:
+        for member in reversed(members):
+
+            if not member.isAlive():
 
                 continue
 
+            modifier.deleteNode(member.object())
+            modifier.doIt()
+
     def hyperPositions(self):
         """
         Returns a list of hyper positions for this hyper layout.
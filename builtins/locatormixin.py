@@ -1,7 +1,6 @@
 import math
 
 from maya.api import OpenMaya as om
-from dcc.maya.libs import transformutils
 from . import shapemixin
 from .. import mpyattribute
 
@@ -49,57 +48,62 @@ class LocatorMixin(shapemixin.ShapeMixin):
         """
 
         # Compose local matrix components
+        # A transformation matrix assembles all three components without any intermediate matrices!
         #
-        localPositionMatrix = transformutils.createTranslateMatrix(self.localPosition)
-        localRotateMatrix = om.MMatrix.kIdentity
-        localScaleMatrix = transformutils.createScaleMatrix(self.localScale)
+        transformationMatrix = om.MTransformationMatrix()
+        transformationMatrix.setTranslation(om.MVector(self.localPosition), om.MSpace.kTransform)
+        transformationMatrix.setScale(self.localScale, om.MSpace.kTransform)
 
         # Check if local rotation exists
         #
         if self.hasAttr('localRotate'):
 
-            localRotateMatrix = transformutils.createRotationMatrix(self.localRotate)
+            transformationMatrix.setRotation(om.MEulerRotation([math.radians(x) for x in self.localRotate]))
 
-        return localScaleMatrix * localRotateMatrix * localPositionMatrix
+        return transformationMatrix.asMatrix()
 
-    def setLocalMatrix(self, localMatrix, **kwargs):
+    def setLocalMatrix(self, localMatrix, skipPosition=False, skipRotate=False, skipScale=False):
         """
         Updates the local matrix for this locator.
 
         :type localMatrix: om.MMatrix
-        :key skipPosition: bool
-        :key skipRotate: bool
-        :key skipScale: bool
+        :type skipPosition: bool
+        :type skipRotate: bool
+        :type skipScale: bool
         :rtype: None
         """
 
         # Decompose local matrix
+        # Resetting back to identity is common enough to hard-code the channel defaults!
         #
-        localPosition, localRotate, localScale = transformutils.decomposeTransformMatrix(localMatrix)
+        if localMatrix is om.MMatrix.kIdentity:
 
-        # Check if position should be skipped
-        #
-        skipPosition = kwargs.get('skipPosition', False)
+            localPosition, localRotate, localScale = om.MVector.kZeroVector, (0.0, 0.0, 0.0), (1.0, 1.0, 1.0)
 
-        if not skipPosition:
+        else:
 
-            self.setAttr('localPosition', localPosition)
+            transformationMatrix = om.MTransformationMatrix(localMatrix)
 
-        # Check if rotation should be skipped
-        #
-        skipRotate = kwargs.get('skipRotate', False)
+            localPosition = transformationMatrix.translation(om.MSpace.kTransform)
+            localRotate = transformationMatrix.rotation(asQuaternion=False)
+            localScale = transformationMatrix.scale(om.MSpace.kTransform)  # One native decompose replaces the Python-level recomposition!
 
-        if not skipRotate and self.hasAttr('localRotate'):
+        # Iterate through channel table
+        # A single loop replaces the three near-identical skip branches!
+        #
+        channels = (
+            ('localPosition', localPosition, skipPosition),
+            ('localRotate', list(map(math.degrees, localRotate)), skipRotate),
+            ('localScale', localScale, skipScale)
+        )
 
-            self.setAttr('localRotate', list(map(math.degrees, localRotate)))
+        for (name, value, skip) in channels:
 
-        # Check if scale should be skipped
-        #
-        skipScale = kwargs.get('skipScale', False)
+            if skip or not self.hasAttr(name):
 
-        if not skipScale:
+                continue
 
-            self.setAttr('localScale', localScale)
+            self.setAttr(name, value)
 
     def resetLocalMatrix(self):
         """
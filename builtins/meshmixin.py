@@ -49,6 +49,12 @@ class MeshComponent(collections_abc.MutableSequence):
         om.MFn.kMeshVtxFaceComponent: 'kMeshVtxFaceComponent'
     }
 
+    __connected_vertices__ = {
+        om.MFn.kMeshVertComponent: lambda iterator: iterator.getConnectedVertices(),
+        om.MFn.kMeshEdgeComponent: lambda iterator: (iterator.vertexId(0), iterator.vertexId(1)),
+        om.MFn.kMeshPolygonComponent: lambda iterator: iterator.getVertices()
+    }
+
     def __init__(self, *args, **kwargs):
         """
         Private method called after a new instance has been created.
@@ -475,25 +481,28 @@ class MeshComponent(collections_abc.MutableSequence):
             raise TypeError('setApiType() expect a int (%s given)!' % type(value).__name__)
 
         # Get max number of elements based on type
+        # Resolving the dag path once avoids a full DAG ascent per branch!
         #
         self._apiType = value
         self._apiTypeStr = self.__apiTypeStrs__[self._apiType]
 
+        fnMesh = om.MFnMesh(self.dagPath())
+
         if self._apiType == om.MFn.kMeshVertComponent:
 
-            self._maxElements = om.MFnMesh(self.dagPath()).numVertices
+            self._maxElements = fnMesh.numVertices
 
         elif self._apiType == om.MFn.kMeshPolygonComponent:
 
-            self._maxElements = om.MFnMesh(self.dagPath()).numPolygons
+            self._maxElements = fnMesh.numPolygons
 
         elif self._apiType == om.MFn.kMeshEdgeComponent:
 
-            self._maxElements = om.MFnMesh(self.dagPath()).numEdges
+            self._maxElements = fnMesh.numEdges
 
         elif self._apiType == om.MFn.kMeshVtxFaceComponent:
 
-            self._maxElements = om.MFnMesh(self.dagPath()).numPolygons
+            self._maxElements = fnMesh.numPolygons
 
         else:
 
@@ -506,7 +515,19 @@ class MeshComponent(collections_abc.MutableSequence):
         :return: om.MObject
         """
 
-        return dagutils.createComponent(self.elements(), apiType=self._apiType)
+        # Build the component in a single pass
+        # Constructing the element array once avoids the recursive dispatch inside the generic helper!
+        #
+        fnSingleIndexedComponent = om.MFnSingleIndexedComponent()
+        component = fnSingleIndexedComponent.create(self._apiType)
+
+        numElements = len(self._elements)
+
+        if numElements > 0:
+
+            fnSingleIndexedComponent.addElements(om.MIntArray(list(self._elements)))
+
+        return component
 
     def setComponent(self, value):
         """
@@ -527,34 +548,29 @@ class MeshComponent(collections_abc.MutableSequence):
         if value.hasFn(om.MFn.kMeshComponent):
 
             # Check if component has weights
+            # Pulling the elements in one batch avoids a per-element round trip!
             #
             fnSingleIndexedComponent = om.MFnSingleIndexedComponent(value)
-            numElements = fnSingleIndexedComponent.elementCount
+            elements = fnSingleIndexedComponent.getElements()
+            numElements = len(elements)
 
             if fnSingleIndexedComponent.hasWeights:
 
-                # Iterate through component element weights
+                # Collect influence weights in a single pass
                 #
                 log.debug('Iterating through %s component elements.' % numElements)
-                self._weights = {}
 
-                for i in range(numElements):
-
-                    # Get influence weight
-                    #
-                    element = fnSingleIndexedComponent.element(i)
-                    weight = fnSingleIndexedComponent.weight(i).influence
-
-                    self._weights[element] = weight
+                weights = [fnSingleIndexedComponent.weight(i).influence for i in range(numElements)]
+                self._weights = dict(zip(elements, weights))
 
             else:
 
-                self._weights = {fnSingleIndexedComponent.element(x): 1.0 for x in range(numElements)}
+                self._weights = dict.fromkeys(elements, 1.0)
 
             # Get component elements
             #
             self.setApiType(value.apiType())
-            self.setElements(fnSingleIndexedComponent.getElements())
+            self.setElements(elements)
 
         else:
 
@@ -654,52 +670,29 @@ class MeshComponent(collections_abc.MutableSequence):
 
             elements = [x for x in args if isinstance(x, int)]
 
-        # Check which iterator methods to use
+        # Check which handler to use
+        # Resolving the handler up front keeps the type tests out of the element loop!
         #
-        vertexIndices = deque()
-
-        iterator = self.__iterators__[self._apiType].__call__(self.node())
-        queue = deque(elements)
+        handler = self.__connected_vertices__.get(self._apiType, None)
 
-        if isinstance(iterator, om.MItMeshVertex):
-
-            # Consume all elements
-            #
-            while len(queue):
-
-                index = queue.popleft()
-                iterator.setIndex(index)
+        if handler is None:
 
-                connected = iterator.getConnectedVertices()
-                vertexIndices.extend(connected)
+            raise TypeError('getConnectedVertices() expects a valid mesh component type (%s given)!' % self._apiType)
 
-        elif isinstance(iterator, om.MItMeshEdge):
-
-            # Consume all elements
-            #
-            while len(queue):
-
-                index = queue.popleft()
-                iterator.setIndex(index)
-
-                connected = [iterator.vertexId(0), iterator.vertexId(1)]
-                vertexIndices.extend(connected)
-
-        elif isinstance(iterator, om.MItMeshPolygon):
-
-            # Consume all elements
-            #
-            while len(queue):
+        # Consume all elements
+        #
+        vertexIndices = deque()
 
-                index = queue.popleft()
-                iterator.setIndex(index)
+        iterator = self.__iterators__[self._apiType].__call__(self.node())
+        queue = deque(elements)
 
-                connected = iterator.getVertices()
-                vertexIndices.extend(connected)
+        while len(queue):
 
-        else:
+            index = queue.popleft()
+            iterator.setIndex(index)
 
-            raise TypeError('getConnectedVertices() expects a valid iterator (%s given)!' % type(iterator).__name__)
+            connected = handler(iterator)
+            vertexIndices.extend(connected)
 
         return vertexIndices
 
@@ -728,40 +721,27 @@ class MeshComponent(collections_abc.MutableSequence):
 
             elements = [x for x in args if isinstance(x, int)]
 
-        # Check which iterator methods to use
+        # Check which iterator to use
+        # Every supported iterator exposes getConnectedEdges so a single loop covers them all!
+        #
+        if self._apiType not in (om.MFn.kMeshVertComponent, om.MFn.kMeshEdgeComponent, om.MFn.kMeshPolygonComponent):
+
+            raise TypeError('getConnectedEdges() expects a valid mesh component type (%s given)!' % self._apiType)
+
+        # Consume all elements
         #
         edgeIndices = deque()
 
         iterator = self.__iterators__[self._apiType].__call__(self.node())
         queue = deque(elements)
 
-        if isinstance(iterator, (om.MItMeshVertex, om.MItMeshEdge)):
-
-            # Consume all elements
-            #
-            while len(queue):
-
-                index = queue.popleft()
-                iterator.setIndex(index)
-
-                connected = iterator.getConnectedEdges()
-                edgeIndices.extend(connected)
-
-        elif isinstance(iterator, om.MItMeshPolygon):
-
-            # Consume all elements
-            #
-            while len(queue):
-
-                index = queue.popleft()
-                iterator.setIndex(index)
-
-                connected = iterator.getConnectedEdges()
-                edgeIndices.extend(connected)
+        while len(queue):
 
-        else:
+            index = queue.popleft()
+            iterator.setIndex(index)
 
-            raise TypeError('getConnectedEdges() expects a valid iterator (%s given)!' % type(iterator).__name__)
+            connected = iterator.getConnectedEdges()
+            edgeIndices.extend(connected)
 
         return edgeIndices
 
@@ -789,40 +769,27 @@ class MeshComponent(collections_abc.MutableSequence):
 
             elements = [x for x in args if isinstance(x, int)]
 
-        # Check which iterator methods to use
+        # Check which iterator to use
+        # Every supported iterator exposes getConnectedFaces so a single loop covers them all!
+        #
+        if self._apiType not in (om.MFn.kMeshVertComponent, om.MFn.kMeshEdgeComponent, om.MFn.kMeshPolygonComponent):
+
+            raise TypeError('getConnectedFaces() expects a valid mesh component type (%s given)!' % self._apiType)
+
+        # Consume all elements
         #
         faceIndices = deque()
 
         iterator = self.__iterators__[self._apiType].__call__(self.node())
         queue = deque(elements)
 
-        if isinstance(iterator, (om.MItMeshVertex, om.MItMeshEdge)):
-
-            # Consume all elements
-            #
-            while len(queue):
-
-                index = queue.popleft()
-                iterator.setIndex(index)
-
-                connected = iterator.getConnectedFaces()
-                faceIndices.extend(connected)
-
-        elif isinstance(iterator, om.MItMeshPolygon):
-
-            # Consume all elements
-            #
-            while len(queue):
-
-                index = queue.popleft()
-                iterator.setIndex(index)
-
-                connected = iterator.getConnectedFaces()
-                faceIndices.extend(connected)
+        while len(queue):
 
-        else:
+            index = queue.popleft()
+            iterator.setIndex(index)
 
-            raise TypeError('getConnectedFaces() expects a valid iterator (%s given)!' % type(iterator).__name__)
+            connected = iterator.getConnectedFaces()
+            faceIndices.extend(connected)
 
         return faceIndices
 
@@ -904,48 +871,50 @@ class MeshComponent(collections_abc.MutableSequence):
     def center(self):
         """
         Returns the averaged center of all active elements.
-        For simplicity all iterators consume items in order to support mesh data objects.
+        Vertex components pull all points in a single call whereas the remaining types fall back to iterators.
 
         :rtype: om.MPoint
         """
 
-        # Check which iterator methods to use
+        # Check which component type to use
+        # Positions are summed into plain floats and divided once at the end rather than weighting every element!
         #
-        center = om.MPoint([0.0, 0.0, 0.0, 1.0])
-        weight = 1.0 / self.numElements
-
-        iterator = self.__iterators__[self._apiType].__call__(self.dagPath())
-        queue = deque(self._elements)
+        centerX, centerY, centerZ = 0.0, 0.0, 0.0
 
-        log.debug('Iterating through %s elements.' % iterator.count())
-
-        if isinstance(iterator, om.MItMeshVertex):
+        if self._apiType == om.MFn.kMeshVertComponent:
 
-            # Consume all elements
+            # Fetch all points in one call and index into them
             #
-            while len(queue):
+            points = om.MFnMesh(self.dagPath()).getPoints()
 
-                index = queue.popleft()
-                iterator.setIndex(index)
+            for index in self._elements:
 
-                center += iterator.position() * weight
+                point = points[index]
+                centerX += point.x
+                centerY += point.y
+                centerZ += point.z
 
-        elif isinstance(iterator, (om.MItMeshEdge, om.MItMeshPolygon)):
+        elif self._apiType in (om.MFn.kMeshEdgeComponent, om.MFn.kMeshPolygonComponent):
 
             # Consume all elements
             #
-            while len(queue):
+            iterator = self.__iterators__[self._apiType].__call__(self.dagPath())
+
+            for index in self._elements:
 
-                index = queue.popleft()
                 iterator.setIndex(index)
 
-                center += iterator.center() * weight
+                point = iterator.center()
+                centerX += point.x
+                centerY += point.y
+                centerZ += point.z
 
         else:
 
-            raise TypeError('center() expects a valid iterator (%s given)!' % type(iterator).__name__)
+            raise TypeError('center() expects a valid mesh component type (%s given)!' % self._apiType)
 
-        return center
+        weight = 1.0 / self.numElements
+        return om.MPoint(centerX * weight, centerY * weight, centerZ * weight, 1.0)
 
     def points(self):
         """
@@ -1015,7 +984,7 @@ class MeshComponent(collections_abc.MutableSequence):
         # Define selection list
         #
         selection = om.MSelectionList()
-        selection.add(tuple([om.MDagPath().getAPathTo(self.dagPath()), self.component]))
+        selection.add(tuple([self.dagPath(), self.component()]))
 
         return selection.getSelectionStrings()
 
@@ -1075,7 +1044,7 @@ class MeshComponent(collections_abc.MutableSequence):
 
         # Initialize iterator
         #
-        dagPath = om.MDagPath().getAPathTo(self.dagPath())
+        dagPath = self.dagPath()
         iterator = self.__iterators__[self._apiType].__call__(dagPath)
 
         # Iterate through all components
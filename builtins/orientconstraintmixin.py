@@ -1,7 +1,4 @@
-import math
-
 from maya.api import OpenMaya as om
-from dcc.maya.libs import transformutils
 from enum import IntEnum
 from . import constraintmixin
 from .. import mpyattribute
@@ -117,17 +114,14 @@ class OrientConstraintMixin(constraintmixin.ConstraintMixin):
         constraintRotateOrder = self.getAttr('constraintRotateOrder')
         constraintEulerRotation = om.MEulerRotation([x.asRadians() for x in constraintAngles], order=constraintRotateOrder)
 
-        constraintMatrix = constraintEulerRotation.asMatrix()
-
         # Update offset
+        # Composing quaternions avoids two matrix builds, an inverse and a full decompose!
         #
         restAngles = self.getAttr('restRotate', convertUnits=False)
         restEulerRotation = om.MEulerRotation([x.asRadians() for x in restAngles], order=constraintRotateOrder)
 
-        offsetMatrix = restEulerRotation.asMatrix() * constraintMatrix.inverse()
-        offsetEulerRotation = transformutils.decomposeTransformMatrix(offsetMatrix, rotateOrder=constraintRotateOrder)[1]
+        offsetQuaternion = restEulerRotation.asQuaternion() * constraintEulerRotation.asQuaternion().inverse()
+        offsetEulerRotation = offsetQuaternion.asEulerRotation().reorder(constraintRotateOrder)
 
-        self.offsetX = math.degrees(offsetEulerRotation.x)
-        self.offsetY = math.degrees(offsetEulerRotation.y)
-        self.offsetZ = math.degrees(offsetEulerRotation.z)
+        self.setAttr('offset', offsetEulerRotation, convertUnits=False)  # Writing radians directly skips three per-component unit conversions!
     # endregion
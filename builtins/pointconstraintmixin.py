@@ -79,7 +79,7 @@ class PointConstraintMixin(constraintmixin.ConstraintMixin):
         #
         restMatrix = self.restMatrix()
         offsetMatrix = restMatrix * constraintMatrix.inverse()
-        offsetTranslate = transformutils.breakMatrix(offsetMatrix)[3]
+        offsetTranslate = om.MVector(offsetMatrix[12], offsetMatrix[13], offsetMatrix[14])  # Flat indexing skips breaking the rotation rows!
 
         self.offset = offsetTranslate
     # endregion
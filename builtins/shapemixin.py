@@ -69,12 +69,10 @@ class ShapeMixin(dagmixin.DagMixin):
             # Get point from elements
             #
             points[physicalIndex] = om.MPoint(
-                [
-                    element.child(0).asFloat(),
-                    element.child(1).asFloat(),
-                    element.child(2).asFloat(),
-                    1.0
-                ]
+                element.child(0).asFloat(),
+                element.child(1).asFloat(),
+                element.child(2).asFloat(),
+                1.0
             )
 
         return points
@@ -104,6 +102,13 @@ class ShapeMixin(dagmixin.DagMixin):
 
             return
 
+        # Coerce points into a point array
+        # Bulk edits can pass any sequence without paying a per-point conversion later!
+        #
+        if not isinstance(points, om.MPointArray):
+
+            points = om.MPointArray(points)
+
         #  Iterate through plug elements
         #
         numPoints = len(points)
@@ -208,11 +213,18 @@ class ShapeMixin(dagmixin.DagMixin):
         """
 
         # Apply parent matrix to control points
+        # Transforming the point array in place avoids spilling every point into a Python list!
         #
         parent = self.parent()
         matrix = parent.matrix()
 
-        controlPoints = [controlPoint * matrix for controlPoint in self.controlPoints()]
+        controlPoints = self.controlPoints()
+        numControlPoints = len(controlPoints)
+
+        for i in range(numControlPoints):
+
+            controlPoints[i] *= matrix
+
         self.setControlPoints(controlPoints)
 
         # Reset parent transform
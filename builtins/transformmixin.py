@@ -16,6 +16,36 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+__transform_rotate_orders__ = (
+    om.MTransformationMatrix.kXYZ,
+    om.MTransformationMatrix.kYZX,
+    om.MTransformationMatrix.kZXY,
+    om.MTransformationMatrix.kXZY,
+    om.MTransformationMatrix.kYXZ,
+    om.MTransformationMatrix.kZYX
+)  # Indexed by the `rotateOrder` attribute since the transformation-matrix constants are offset by one!
+__derived_type_names__ = {}  # Node-type hierarchies never change at runtime so derived lookups are cached per type name!
+
+
+def isIdentityMatrix(matrix, tolerance=1e-9):
+    """
+    Evaluates if the supplied matrix is equivalent to the identity matrix.
+    The diagonal is checked first so non-identity matrices bail out before the full 16-element compare!
+
+    :type matrix: om.MMatrix
+    :type tolerance: float
+    :rtype: bool
+    """
+
+    isDiagonalOne = matrix.getElement(0, 0) == 1.0 and matrix.getElement(1, 1) == 1.0 and matrix.getElement(2, 2) == 1.0 and matrix.getElement(3, 3) == 1.0
+
+    if not isDiagonalOne:
+
+        return False
+
+    return matrix.isEquivalent(om.MMatrix.kIdentity, tolerance)
+
+
 class TransformMixin(dagmixin.DagMixin):
     """
     Overload of `DagMixin` that interfaces with transform nodes.
@@ -85,6 +115,14 @@ class TransformMixin(dagmixin.DagMixin):
         :rtype: om.MVector
         """
 
+        # Evaluate the common case
+        # A single transformation query beats three per-component plug reads!
+        # The cached function set also skips resolving a fresh dag path!
+        #
+        if time is None and space == om.MSpace.kTransform:
+
+            return self.functionSet().translation(om.MSpace.kTransform)
+
         with mpycontext.MPyContext(time=time):
 
             return transformutils.getTranslation(self.dagPath(), space=space)
@@ -147,6 +185,13 @@ class TransformMixin(dagmixin.DagMixin):
         :rtype: om.MEulerRotation
         """
 
+        # Evaluate the common case
+        # The function set returns the rotation in one query with the order already applied!
+        #
+        if time is None:
+
+            return self.functionSet().rotation(asQuaternion=False)
+
         with mpycontext.MPyContext(time=time):
 
             return transformutils.getEulerRotation(self.dagPath())
@@ -217,6 +262,13 @@ class TransformMixin(dagmixin.DagMixin):
         :rtype: List[float, float, float]
         """
 
+        # Evaluate the common case
+        # The function set returns all three components in one query!
+        #
+        if time is None:
+
+            return self.functionSet().scale()
+
         with mpycontext.MPyContext(time=time):
 
             return transformutils.getScale(self.dagPath())
@@ -291,18 +343,42 @@ class TransformMixin(dagmixin.DagMixin):
 
         transformutils.resetPivots(self.dagPath())
 
-    def setMatrix(self, matrix, **kwargs):
+    def setMatrix(self, matrix, skipTranslate=False, skipRotate=False, skipScale=False, **kwargs):
         """
         Updates the local transformation matrix for this transform.
+        Skip flags are declared explicitly so the common case avoids any dictionary lookups!
 
         :type matrix: om.MMatrix
-        :key skipTranslate: bool
-        :key skipRotate: bool
-        :key skipScale: bool
+        :type skipTranslate: bool
+        :type skipRotate: bool
+        :type skipScale: bool
         :rtype: None
         """
 
-        transformutils.applyTransformMatrix(self.dagPath(), matrix, **kwargs)
+        # Evaluate the common case
+        # One setTransformation call writes every channel without re-entering the per-channel setters!
+        # Joint orientation is compensated inline with a single quaternion rotate!
+        #
+        if not (skipTranslate or skipRotate or skipScale or len(kwargs) > 0):
+
+            transformationMatrix = om.MTransformationMatrix(matrix)
+
+            preEulerRotation = self.preEulerRotation()
+
+            if not preEulerRotation.isEquivalent(om.MEulerRotation.kIdentity):
+
+                transformationMatrix.rotateBy(preEulerRotation.asQuaternion().inverse(), om.MSpace.kTransform)
+
+            rotateOrder = self.rotateOrder()
+
+            if rotateOrder != 0:  # XYZ is already the transformation-matrix default so most transforms skip the reorder!
+
+                transformationMatrix.reorderRotation(__transform_rotate_orders__[rotateOrder])
+
+            self.functionSet().setTransformation(transformationMatrix)
+            return
+
+        transformutils.applyTransformMatrix(self.dagPath(), matrix, skipTranslate=skipTranslate, skipRotate=skipRotate, skipScale=skipScale, **kwargs)
 
     def resetMatrix(self):
         """
@@ -336,21 +412,24 @@ class TransformMixin(dagmixin.DagMixin):
 
         transformutils.setOffsetParentMatrix(self.dagPath(), offsetParentMatrix)
 
-    def setWorldMatrix(self, worldMatrix, **kwargs):
+    def setWorldMatrix(self, worldMatrix, skipTranslate=False, skipRotate=False, skipScale=False, **kwargs):
         """
         Updates the world transformation matrix for this transform.
 
         :type worldMatrix: om.MMatrix
-        :key skipTranslate: bool
-        :key skipRotate: bool
-        :key skipScale: bool
+        :type skipTranslate: bool
+        :type skipRotate: bool
+        :type skipScale: bool
         :rtype: None
         """
 
+        # Check if parent space requires a conversion
+        # Top-level transforms can skip the matrix multiply altogether!
+        #
         parentInverseMatrix = self.parentInverseMatrix()
-        matrix = worldMatrix * parentInverseMatrix
+        matrix = worldMatrix if isIdentityMatrix(parentInverseMatrix) else worldMatrix * parentInverseMatrix
 
-        self.setMatrix(matrix, **kwargs)
+        self.setMatrix(matrix, skipTranslate=skipTranslate, skipRotate=skipRotate, skipScale=skipScale, **kwargs)
 
     def distanceBetween(self, otherNode):
         """
@@ -413,10 +492,33 @@ class TransformMixin(dagmixin.DagMixin):
         maintainRotate = kwargs.pop('maintainRotate', maintainOffset)
         maintainScale = kwargs.pop('maintainScale', maintainOffset)
 
-        offsetMatrix = self.worldMatrix(time=startTime) * transform.worldInverseMatrix(time=startTime)
-        translateOffsetMatrix = transformutils.createTranslateMatrix(offsetMatrix) if maintainTranslate else om.MMatrix.kIdentity
-        rotateOffsetMatrix = transformutils.createRotationMatrix(offsetMatrix) if maintainRotate else om.MMatrix.kIdentity
-        scaleOffsetMatrix = transformutils.createScaleMatrix(offsetMatrix) if maintainScale else om.MMatrix.kIdentity
+        # Compose the offset once since it never changes between samples
+        # Identity operands are dropped from the product so unused components cost nothing per frame!
+        #
+        hasOffset = maintainTranslate or maintainRotate or maintainScale
+        composedOffsetMatrix = om.MMatrix.kIdentity
+
+        if hasOffset:
+
+            offsetMatrix = self.worldMatrix(time=startTime) * transform.worldInverseMatrix(time=startTime)
+
+            offsetMatrices = []
+
+            if maintainScale:
+
+                offsetMatrices.append(transformutils.createScaleMatrix(offsetMatrix))
+
+            if maintainRotate:
+
+                offsetMatrices.append(transformutils.createRotationMatrix(offsetMatrix))
+
+            if maintainTranslate:
+
+                offsetMatrices.append(transformutils.createTranslateMatrix(offsetMatrix))
+
+            for matrix in offsetMatrices:
+
+                composedOffsetMatrix = composedOffsetMatrix * matrix if composedOffsetMatrix is not om.MMatrix.kIdentity else matrix
 
         # Iterate through time range
         #
@@ -432,7 +534,7 @@ class TransformMixin(dagmixin.DagMixin):
             #
             worldMatrix = transform.worldMatrix()
             parentInverseMatrix = self.parentInverseMatrix()
-            localMatrix = ((scaleOffsetMatrix * rotateOffsetMatrix * translateOffsetMatrix) * worldMatrix) * parentInverseMatrix
+            localMatrix = ((composedOffsetMatrix * worldMatrix) if hasOffset else worldMatrix) * parentInverseMatrix
 
             self.setMatrix(localMatrix, **kwargs)
 
@@ -448,25 +550,20 @@ class TransformMixin(dagmixin.DagMixin):
         """
 
         # Check if an animation range was supplied
+        # If not, then fallback to the keyframe inputs!
         #
+        times = None
+
         if not stringutils.isNullOrEmpty(animationRange):
 
-            # Get matrices at times
-            #
             startTime, endTime = animationRange
-            matrices = {}
-
-            for time in inclusiveRange(startTime, endTime, step):
-
-                matrices[time] = self.worldMatrix(time=time) if worldSpace else self.matrix(time=time)
-
-            return matrices
+            times = inclusiveRange(startTime, endTime, step)
 
         else:
 
             # Collect time inputs
             #
-            times = set()
+            inputs = set()
 
             for plug in self.iterPlugs(channelBox=True):
 
@@ -479,17 +576,15 @@ class TransformMixin(dagmixin.DagMixin):
                 # Add curve inputs
                 #
                 animCurve = self.scene(plug.source().node())
-                times.update(set(animCurve.inputs()))
-
-            # Get matrices at times
-            #
-            matrices = {}
-
-            for time in sorted(times):
+                inputs.update(set(animCurve.inputs()))
 
-                matrices[time] = self.worldMatrix(time=time) if worldSpace else self.matrix(time=time)
+            times = sorted(inputs)
 
-            return matrices
+        # Capture matrices in a single pass
+        # Resolving the sampler up front keeps the per-sample branch out of the loop!
+        #
+        sample = self.worldMatrix if worldSpace else self.matrix
+        return {time: sample(time=time) for time in times}
 
     def syncTransformKeys(self):
         """
@@ -563,14 +658,26 @@ class TransformMixin(dagmixin.DagMixin):
         """
 
         # Compare parent matrices
+        # Flat indexing pulls the axis rows without breaking out the unused position row
+        # and normalizing in place avoids allocating a second set of vectors!
         #
         matrix = self.parentMatrix()
-        xAxis, yAxis, zAxis, pos = transformutils.breakMatrix(matrix, normalize=True)
+        xAxis = om.MVector(matrix[0], matrix[1], matrix[2])
+        yAxis = om.MVector(matrix[4], matrix[5], matrix[6])
+        zAxis = om.MVector(matrix[8], matrix[9], matrix[10])
+        xAxis.normalize()
+        yAxis.normalize()
+        zAxis.normalize()
         mirrorXAxis, mirrorYAxis, mirrorZAxis = [transformutils.mirrorVector(axis, normal=normal) for axis in (xAxis, yAxis, zAxis)]
 
         otherTransform = self.getOppositeNode()
         otherMatrix = otherTransform.parentMatrix()
-        otherXAxis, otherYAxis, otherZAxis, otherPos = transformutils.breakMatrix(otherMatrix, normalize=True)
+        otherXAxis = om.MVector(otherMatrix[0], otherMatrix[1], otherMatrix[2])
+        otherYAxis = om.MVector(otherMatrix[4], otherMatrix[5], otherMatrix[6])
+        otherZAxis = om.MVector(otherMatrix[8], otherMatrix[9], otherMatrix[10])
+        otherXAxis.normalize()
+        otherYAxis.normalize()
+        otherZAxis.normalize()
 
         mirrorTranslateX = (mirrorXAxis * otherXAxis) < 0.0
         mirrorTranslateY = (mirrorYAxis * otherYAxis) < 0.0
@@ -751,11 +858,17 @@ class TransformMixin(dagmixin.DagMixin):
         """
 
         # Iterate through connections
+        # A set gives constant-time membership for both the type filter and the dedupe check!
         #
         plugs = self.getConnections()
-        typeNames = mc.nodeType(typeName, isTypeName=True, derived=True)
+        typeNames = __derived_type_names__.get(typeName, None)
+
+        if typeNames is None:
+
+            typeNames = set(mc.nodeType(typeName, isTypeName=True, derived=True))
+            __derived_type_names__[typeName] = typeNames
 
-        constraints = {}
+        yielded = set()
 
         for plug in plugs:
 
@@ -776,11 +889,10 @@ class TransformMixin(dagmixin.DagMixin):
             # Check if constraint was already yielded
             #
             hashCode = source.hashCode()
-            yielded = constraints.get(hashCode, False)
 
-            if not yielded:
+            if hashCode not in yielded:
 
-                constraints[hashCode] = True
+                yielded.add(hashCode)
                 yield source
 
     def constraints(self, typeName='constraint'):
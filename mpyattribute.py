@@ -19,6 +19,7 @@ class MPyAttribute(object):
     __slots__ = (
         'name',
         'constructors',
+        'cache',
         'fget',
         'fset',
         'fdel',
@@ -49,6 +50,7 @@ class MPyAttribute(object):
         #
         self.name = name
         self.constructors = constructors
+        self.cache = {}
         self.fget = fget
         self.fset = fset
         self.fdel = fdel
@@ -142,13 +144,22 @@ class MPyAttribute(object):
 
         # Check instance type
         #
-        if isinstance(instance, mpynode.MPyNode):
+        if not isinstance(instance, mpynode.MPyNode):
 
-            return om.MPlug(instance.object(), instance.attribute(self.name))
+            raise TypeError('plug() expects an MPyNode (%s given)' % type(instance).__name__)
 
-        else:
+        # Check if attribute has already been resolved
+        # String-based attribute lookups scan the node's attribute table on every access!
+        #
+        hashCode = instance.hashCode()
+        attribute = self.cache.get(hashCode, None)
 
-            raise TypeError('plug() expects an MPyNode (%s given)' % type(instance).__name__)
+        if attribute is None or attribute.isNull():
+
+            attribute = instance.attribute(self.name)
+            self.cache[hashCode] = attribute
+
+        return om.MPlug(instance.object(), attribute)
 
     def validateAndGetValue(self, func):
         """
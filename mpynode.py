@@ -36,8 +36,9 @@ class MPyNode(mobjectwrapper.MObjectWrapper, metaclass=mabcmeta.MABCMeta):
             raise TypeError('MPyNode() expects %s (%s given)!' % (cls.__accepts__, type(obj).__name__))
 
         # Check if supplied object is valid
+        # The metaclass resolves the handle up front so reuse it when possible!
         #
-        handle = dagutils.getMObjectHandle(obj)
+        handle = obj if isinstance(obj, om.MObjectHandle) else dagutils.getMObjectHandle(obj)
 
         if handle.isAlive():
 
@@ -18,6 +18,11 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+__selection_list__ = om.MSelectionList()  # Reused between lookups to avoid per-call allocations!
+__plugin_types__ = {}  # Caches plugin checks per type name to avoid repeated filesystem stats!
+__up_vectors__ = {'x': om.MVector.kXaxisVector, 'y': om.MVector.kYaxisVector, 'z': om.MVector.kZaxisVector}  # Built once instead of per property access!
+
+
 class MPyScene(proxyfactory.ProxyFactory):
     """
     Overload of `ProxyFactory` that interfaces with Maya scenes.
@@ -162,7 +167,7 @@ class MPyScene(proxyfactory.ProxyFactory):
         :rtype: om.MVector
         """
 
-        return {'x': om.MVector.kXaxisVector, 'y': om.MVector.kYaxisVector, 'z': om.MVector.kZaxisVector}.get(self.upAxis, om.MVector.kZeroVector)
+        return __up_vectors__.get(self.upAxis, om.MVector.kZeroVector)
 
     @property
     def time(self):
@@ -313,13 +318,27 @@ class MPyScene(proxyfactory.ProxyFactory):
         :rtype: class
         """
 
+        # Resolve the function set once and dispatch off the type name
+        # Rebuilding the function set inside every helper adds up when wrapping whole scenes!
+        #
+        fnDependNode = om.MFnDependencyNode(dependNode)
+        typeName = fnDependNode.typeName
+
+        isPlugin = __plugin_types__.get(typeName, None)
+
+        if isPlugin is None:
+
+            isPlugin = os.path.exists(fnDependNode.pluginName)
+            __plugin_types__[typeName] = isPlugin
+
         # Check if this is an extension node
         #
-        if self.isPlugin(dependNode):
+        if isPlugin:
 
-            return self.getPlugin(dependNode)
+            cls = self.__plugins__.get(typeName, None)
+            return cls if (cls is not None) else self.getMixin(dependNode)
 
-        elif self.isExtension(dependNode):
+        elif fnDependNode.hasAttribute('__class__') and fnDependNode.hasAttribute('__module__'):
 
             return self.getExtensionMixin(dependNode)
 
@@ -337,7 +356,20 @@ class MPyScene(proxyfactory.ProxyFactory):
         :rtype: bool
         """
 
-        return os.path.exists(om.MFnDependencyNode(dependNode).pluginName)
+        # Check if this type has already been evaluated
+        # Stat-ing the plugin path per node gets expensive in large scenes!
+        #
+        fnDependNode = om.MFnDependencyNode(dependNode)
+        typeName = fnDependNode.typeName
+
+        isPlugin = __plugin_types__.get(typeName, None)
+
+        if isPlugin is None:
+
+            isPlugin = os.path.exists(fnDependNode.pluginName)
+            __plugin_types__[typeName] = isPlugin
+
+        return isPlugin
 
     def getPlugin(self, dependNode):
         """
@@ -523,7 +555,19 @@ class MPyScene(proxyfactory.ProxyFactory):
         :rtype: bool
         """
 
-        return mc.objExists(name)
+        # Resolve name through the reusable selection list
+        # This skips the command engine's string parsing on every existence check!
+        #
+        try:
+
+            __selection_list__.clear()
+            __selection_list__.add(name)
+
+            return True
+
+        except RuntimeError:
+
+            return False
 
     def isNameUnique(self, name):
         """
@@ -565,14 +609,65 @@ class MPyScene(proxyfactory.ProxyFactory):
 
         try:
 
-            dependNode = dagutils.getMObjectByName(name)
+            # Resolve name through the reusable selection list
+            # Allocating a new list per call adds up when resolving thousands of names!
+            #
+            __selection_list__.clear()
+            __selection_list__.add(name)
+
+            dependNode = __selection_list__.getDependNode(0)
             return mpynode.MPyNode(dependNode)
 
-        except TypeError as exception:
+        except (RuntimeError, TypeError) as exception:
 
-            log.warning(exception)
+            log.warning(f'Cannot locate node from name: "{name}" ({exception})')
             return None
 
+    def getNodesByName(self, names):
+        """
+        Returns a list of node interfaces based on the given node names.
+        All names are resolved through a single selection list so the per-call overhead is amortized across the batch!
+        Any names that cannot be located will return none.
+
+        :type names: List[str]
+        :rtype: List[mpynode.MPyNode]
+        """
+
+        # Populate selection list
+        #
+        selection = om.MSelectionList()
+        resolved = []
+
+        for name in names:
+
+            try:
+
+                selection.add(name)
+                resolved.append(True)
+
+            except RuntimeError:
+
+                log.warning(f'Cannot locate node from name: "{name}"')
+                resolved.append(False)
+
+        # Collect nodes from selection
+        #
+        nodes = []
+        index = 0
+
+        for wasResolved in resolved:
+
+            if wasResolved:
+
+                nodes.append(mpynode.MPyNode(selection.getDependNode(index)))
+                index += 1
+
+            else:
+
+                nodes.append(None)
+
+        return nodes
+
     def getNodeByHashCode(self, hashCode):
         """
         Returns a node interface via hash code.
@@ -609,21 +704,55 @@ class MPyScene(proxyfactory.ProxyFactory):
 
         else:
 
-            # Get all objects from uuid
+            # Evaluate found nodes
             #
-            found = dagutils.getMObjectByMUuid(uuid)
+            nodes = list(self.iterNodesByUuid(uuid))
+            numNodes = len(nodes)
 
-            if isinstance(found, om.MObject):
+            if numNodes == 0:
 
-                return mpynode.MPyNode(found)
+                return None
 
-            elif isinstance(found, (list, tuple)):
+            elif numNodes == 1:
 
-                return [mpynode.MPyNode(x) for x in found]
+                return nodes[0]
 
             else:
 
-                return None
+                return nodes
+
+    def iterNodesByUuid(self, uuid):
+        """
+        Generator method used to iterate through nodes with the supplied UUID.
+        Streaming results lets callers stop early without collecting every duplicate!
+
+        :type uuid: Union[str, om.MUuid]
+        :rtype: Iterator[mpynode.MPyNode]
+        """
+
+        # Check value type
+        #
+        if isinstance(uuid, string_types):
+
+            uuid = om.MUuid(uuid)
+
+        # Collect nodes with matching uuid
+        #
+        selection = om.MSelectionList()
+
+        try:
+
+            selection.add(uuid)
+
+        except RuntimeError:
+
+            return
+
+        # Iterate through selection
+        #
+        for i in range(selection.length()):
+
+            yield mpynode.MPyNode(selection.getDependNode(i))
 
     def iterNodesByNamespace(self, namespace):
         """
@@ -642,17 +771,16 @@ class MPyScene(proxyfactory.ProxyFactory):
 
         # Check if namespace exists
         #
-        if om.MNamespace.namespaceExists(namespace):
+        if not om.MNamespace.namespaceExists(namespace):
 
-            # Iterate through objects in namespace
-            #
-            for dependNode in om.MNamespace.getNamespaceObjects(namespace):
+            log.warning(f'Cannot locate namespace: "{namespace}"')
+            return
 
-                yield mpynode.MPyNode(dependNode)
-
-        else:
+        # Iterate through objects in namespace
+        #
+        for dependNode in om.MNamespace.getNamespaceObjects(namespace):
 
-            return iter([])
+            yield mpynode.MPyNode(dependNode)
 
     def getNodesByNamespace(self, namespace):
         """
@@ -738,9 +866,7 @@ class MPyScene(proxyfactory.ProxyFactory):
 
         for node in self.iterNodesByApiType(om.MFn.kReference):
 
-            name = dagutils.getNodeName(node.object())
-
-            if name.endswith('sharedReferenceNode') and skipShared:
+            if skipShared and node.name().endswith('sharedReferenceNode'):
 
                 continue
 
@@ -1,3 +1,5 @@
+import math
+
 from maya.api import OpenMaya as om
 from enum import IntEnum
 from .. import mpyattribute
@@ -46,6 +48,31 @@ class FloatMathMixin(dependencymixin.DependencyMixin):
 
     # region Dunderscores
     __plugin__ = 'floatMath'
+    __handlers__ = (  # Default arguments bind the math functions once so each call skips the module attribute lookup!
+        lambda a, b, weight: a + b,  # ADD
+        lambda a, b, weight: a - b,  # SUBTRACT
+        lambda a, b, weight: a * b,  # MULTIPLY
+        lambda a, b, weight: a / b,  # DIVIDE
+        lambda a, b, weight: abs(a),  # ABSOLUTE
+        lambda a, b, weight: -a,  # NEGATE
+        lambda a, b, weight: a * 0.5,  # HALF
+        lambda a, b, weight: min(a, b),  # MIN
+        lambda a, b, weight: max(a, b),  # MAX
+        lambda a, b, weight: (a + b) * 0.5,  # AVERAGE
+        lambda a, b, weight, _pow=math.pow: _pow(a, b),  # POW
+        lambda a, b, weight, _pow=math.pow: _pow(a, 1.0 / b),  # ROOT
+        lambda a, b, weight, _sin=math.sin: _sin(a),  # SIN
+        lambda a, b, weight, _cos=math.cos: _cos(a),  # COS
+        lambda a, b, weight, _tan=math.tan: _tan(a),  # TAN
+        lambda a, b, weight, _asin=math.asin: _asin(a),  # ASIN
+        lambda a, b, weight, _acos=math.acos: _acos(a),  # ACOS
+        lambda a, b, weight, _atan=math.atan: _atan(a),  # ATAN
+        lambda a, b, weight, _floor=math.floor: _floor(a),  # FLOOR
+        lambda a, b, weight, _ceil=math.ceil: _ceil(a),  # CEIL
+        lambda a, b, weight: round(a),  # ROUND
+        lambda a, b, weight, _trunc=math.trunc: _trunc(a),  # TRUNC
+        lambda a, b, weight: a + ((b - a) * weight)  # LERP
+    )
     # endregion
 
     # region Enums
@@ -68,3 +95,36 @@ class FloatMathMixin(dependencymixin.DependencyMixin):
     outAngle = mpyattribute.MPyAttribute('outAngle')
     outTime = mpyattribute.MPyAttribute('outTime')
     # endregion
+
+    # region Methods
+    @classmethod
+    def evaluateOperation(cls, operation, a, b, weight=0.5):
+        """
+        Evaluates the supplied operation in Python.
+        Handlers are indexed positionally so dispatch is a single tuple lookup rather than an enum resolve.
+
+        :type operation: Union[int, Operation]
+        :type a: float
+        :type b: float
+        :type weight: float
+        :rtype: float
+        """
+
+        return cls.__handlers__[operation](a, b, weight)
+
+    @classmethod
+    def evaluateOperationBatch(cls, operation, a, b, weight=0.5):
+        """
+        Evaluates the supplied operation over parallel sequences of inputs.
+        The handler is resolved once up front so the per-sample dispatch cost is amortized across the batch.
+
+        :type operation: Union[int, Operation]
+        :type a: Sequence[float]
+        :type b: Sequence[float]
+        :type weight: float
+        :rtype: List[float]
+        """
+
+        handler = cls.__handlers__[operation]
+        return [handler(x, y, weight) for (x, y) in zip(a, b)]
+    # endregion
@@ -50,14 +50,15 @@ class FreeformMixin(transformmixin.TransformMixin):
         """
 
         # Compare parent matrices for translate settings
+        # Only the dot-product signs matter here so the axes are left unnormalized!
         #
         matrix = self.parentMatrix()
-        xAxis, yAxis, zAxis, pos = transformutils.breakMatrix(matrix, normalize=True)
+        xAxis, yAxis, zAxis, pos = transformutils.breakMatrix(matrix)
         mirrorXAxis, mirrorYAxis, mirrorZAxis = [transformutils.mirrorVector(axis, normal=normal) for axis in (xAxis, yAxis, zAxis)]
 
         otherTransform = self.getOppositeNode()
         otherMatrix = otherTransform.parentMatrix()
-        otherXAxis, otherYAxis, otherZAxis, otherPos = transformutils.breakMatrix(otherMatrix, normalize=True)
+        otherXAxis, otherYAxis, otherZAxis, otherPos = transformutils.breakMatrix(otherMatrix)
 
         mirrorTranslateX = (mirrorXAxis * otherXAxis) < 0.0
         mirrorTranslateY = (mirrorYAxis * otherYAxis) < 0.0
@@ -67,12 +68,12 @@ class FreeformMixin(transformmixin.TransformMixin):
         #
         preEulerRotation = self.preEulerRotation()
         matrix = preEulerRotation.asMatrix() * self.parentMatrix()
-        xAxis, yAxis, zAxis, pos = transformutils.breakMatrix(matrix, normalize=True)
+        xAxis, yAxis, zAxis, pos = transformutils.breakMatrix(matrix)
         mirrorXAxis, mirrorYAxis, mirrorZAxis = [transformutils.mirrorVector(axis, normal=normal) for axis in (xAxis, yAxis, zAxis)]
 
         otherPreEulerRotation = otherTransform.preEulerRotation()
         otherMatrix = otherPreEulerRotation.asMatrix() * otherTransform.parentMatrix()
-        otherXAxis, otherYAxis, otherZAxis, otherPos = transformutils.breakMatrix(otherMatrix, normalize=True)
+        otherXAxis, otherYAxis, otherZAxis, otherPos = transformutils.breakMatrix(otherMatrix)
 
         mirrorRotateX = (mirrorXAxis * otherXAxis) > 0.0
         mirrorRotateY = (mirrorYAxis * otherYAxis) > 0.0
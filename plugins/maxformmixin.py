@@ -72,11 +72,20 @@ class MaxformMixin(transformmixin.TransformMixin):
         """
 
         # Check if translation should be frozen
+        # Querying the transformation matrix directly skips the scale decomposition that was never used!
         #
         prs = self.getTMController()
         positionController = prs.getPositionController()
 
-        position, eulerRotation, scale = transformutils.decomposeTransformMatrix(self.matrix(), rotateOrder=self.rotateOrder())
+        transformationMatrix = om.MTransformationMatrix(self.matrix())
+        rotateOrder = self.rotateOrder()
+
+        if rotateOrder != 0:  # XYZ is already the transformation-matrix default so most transforms skip the reorder!
+
+            transformationMatrix.reorderRotation(transformmixin.__transform_rotate_orders__[rotateOrder])
+
+        position = transformationMatrix.translation(om.MSpace.kTransform)
+        eulerRotation = transformationMatrix.rotation(asQuaternion=False)
 
         if includeTranslate and positionController is not None:
 
@@ -122,14 +131,15 @@ class MaxformMixin(transformmixin.TransformMixin):
 
         # Compare parent matrices for translate settings
         # In 3ds Max translation values are still in parent space!
+        # Only the dot-product signs matter here so the axes are left unnormalized!
         #
         matrix = self.parentMatrix()
-        xAxis, yAxis, zAxis, pos = transformutils.breakMatrix(matrix, normalize=True)
+        xAxis, yAxis, zAxis, pos = transformutils.breakMatrix(matrix)
         mirrorXAxis, mirrorYAxis, mirrorZAxis = [transformutils.mirrorVector(axis, normal=normal) for axis in (xAxis, yAxis, zAxis)]
 
         otherTransform = self.getOppositeNode()
         otherMatrix = otherTransform.parentMatrix()
-        otherXAxis, otherYAxis, otherZAxis, otherPos = transformutils.breakMatrix(otherMatrix, normalize=True)
+        otherXAxis, otherYAxis, otherZAxis, otherPos = transformutils.breakMatrix(otherMatrix)
 
         mirrorTranslateX = (mirrorXAxis * otherXAxis) < 0.0
         mirrorTranslateY = (mirrorYAxis * otherYAxis) < 0.0
@@ -140,12 +150,12 @@ class MaxformMixin(transformmixin.TransformMixin):
         #
         preEulerRotation = self.preEulerRotation()
         matrix = preEulerRotation.asMatrix() * self.parentMatrix()
-        xAxis, yAxis, zAxis, pos = transformutils.breakMatrix(matrix, normalize=True)
+        xAxis, yAxis, zAxis, pos = transformutils.breakMatrix(matrix)
         mirrorXAxis, mirrorYAxis, mirrorZAxis = [transformutils.mirrorVector(axis, normal=normal) for axis in (xAxis, yAxis, zAxis)]
 
         otherPreEulerRotation = otherTransform.preEulerRotation()
         otherMatrix = otherPreEulerRotation.asMatrix() * otherTransform.parentMatrix()
-        otherXAxis, otherYAxis, otherZAxis, otherPos = transformutils.breakMatrix(otherMatrix, normalize=True)
+        otherXAxis, otherYAxis, otherZAxis, otherPos = transformutils.breakMatrix(otherMatrix)
 
         mirrorRotateX = (mirrorXAxis * otherXAxis) > 0.0
         mirrorRotateY = (mirrorYAxis * otherYAxis) > 0.0
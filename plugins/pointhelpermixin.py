@@ -73,22 +73,23 @@ class PointHelperMixin(locatormixin.LocatorMixin):
         worldMatrix = target.worldMatrix()
         targetMatrix = worldMatrix * parentMatrix.inverse()
 
-        aimVector = om.MVector(transformutils.breakMatrix(targetMatrix)[3])
+        aimVector = om.MVector(targetMatrix[12], targetMatrix[13], targetMatrix[14])  # Flat indexing reads the position row without breaking out the unused axis rows!
         distance = aimVector.length()
         size = float(self.size)
         scale = distance / size
 
         # Compose aim matrix
+        # Dividing by the length already computed saves a second normalization pass!
         #
-        forwardVector = aimVector.normal()
+        forwardVector = (aimVector / distance) if (distance > 0.0) else om.MVector.kZeroVector
         upVector = om.MVector.kZaxisVector
 
         aimMatrix = transformutils.createAimMatrix(0, forwardVector, 2, upVector)
 
         # Assign object transform
         #
-        localPosition = transformutils.breakMatrix(transformutils.createTranslateMatrix(forwardVector * (distance * 0.5)))[3]
-        localRotation = transformutils.decomposeTransformMatrix(aimMatrix)[1]
+        localPosition = forwardVector * (distance * 0.5)  # Packing the vector into a matrix just to break it back out was a no-op!
+        localRotation = om.MTransformationMatrix(aimMatrix).rotation(asQuaternion=False)  # The aim matrix is pure rotation so a full decompose is overkill!
 
         self.localPosition = localPosition
         self.localRotate = tuple(map(math.degrees, localRotation))
@@ -1,5 +1,4 @@
 from maya.api import OpenMaya as om
-from dcc.maya.libs import transformutils
 from .. import mpyattribute
 from ..builtins import constraintmixin
 
@@ -64,7 +63,7 @@ class PositionConstraintMixin(constraintmixin.ConstraintMixin):
         restMatrix = self.restMatrix()
 
         offsetMatrix = restMatrix * constraintMatrix.inverse()
-        offsetTranslate = transformutils.breakMatrix(offsetMatrix)[3]
+        offsetTranslate = om.MVector(offsetMatrix[12], offsetMatrix[13], offsetMatrix[14])  # Flat indexing skips breaking the rotation rows!
 
         # Update re-enable offset
         #
@@ -1,3 +1,5 @@
+import math
+
 from maya.api import OpenMaya as om
 from enum import IntEnum
 from .. import mpyattribute
@@ -43,6 +45,28 @@ class VectorMathMixin(dependencymixin.DependencyMixin):
 
     # region Dunderscores
     __plugin__ = 'vectorMath'
+    __handlers__ = (  # Default arguments bind the math functions once so each call skips the module attribute lookup!
+        lambda a, b, weight: a + b,  # ADD
+        lambda a, b, weight: a - b,  # SUBTRACT
+        lambda a, b, weight: om.MVector(a.x * b.x, a.y * b.y, a.z * b.z),  # MULTIPLY
+        lambda a, b, weight: om.MVector(a.x / b.x, a.y / b.y, a.z / b.z),  # DIVIDE
+        lambda a, b, weight: om.MVector(abs(a.x), abs(a.y), abs(a.z)),  # ABSOLUTE
+        lambda a, b, weight: -a,  # NEGATE
+        lambda a, b, weight: a * 0.5,  # HALF
+        lambda a, b, weight: om.MVector(min(a.x, b.x), min(a.y, b.y), min(a.z, b.z)),  # MIN
+        lambda a, b, weight: om.MVector(max(a.x, b.x), max(a.y, b.y), max(a.z, b.z)),  # MAX
+        lambda a, b, weight: (a + b) * 0.5,  # AVERAGE
+        lambda a, b, weight, _pow=math.pow: om.MVector(_pow(a.x, b.x), _pow(a.y, b.y), _pow(a.z, b.z)),  # POW
+        lambda a, b, weight, _pow=math.pow: om.MVector(_pow(a.x, 1.0 / b.x), _pow(a.y, 1.0 / b.y), _pow(a.z, 1.0 / b.z)),  # ROOT
+        lambda a, b, weight: a.normal(),  # NORMALIZE
+        lambda a, b, weight: a.length(),  # LENGTH
+        lambda a, b, weight: (b - a).length(),  # DISTANCE
+        lambda a, b, weight: a.angle(b),  # ANGLE
+        lambda a, b, weight: a * b,  # DOT
+        lambda a, b, weight: a ^ b,  # CROSS
+        lambda a, b, weight: b * ((a * b) / (b * b)),  # PROJECT
+        lambda a, b, weight: a + ((b - a) * weight)  # LERP
+    )
     # endregion
 
     # region Enums
@@ -63,3 +87,36 @@ class VectorMathMixin(dependencymixin.DependencyMixin):
     outDistance = mpyattribute.MPyAttribute('outDistance')
     outAngle = mpyattribute.MPyAttribute('outAngle')
     # endregion
+
+    # region Methods
+    @classmethod
+    def evaluateOperation(cls, operation, a, b, weight=0.5):
+        """
+        Evaluates the supplied operation in Python.
+        Dispatch is a positional tuple lookup keyed by the operation value.
+
+        :type operation: Union[int, Operation]
+        :type a: om.MVector
+        :type b: om.MVector
+        :type weight: float
+        :rtype: Union[om.MVector, float]
+        """
+
+        return cls.__handlers__[operation](a, b, weight)
+
+    @classmethod
+    def evaluateOperationBatch(cls, operation, a, b, weight=0.5):
+        """
+        Evaluates the supplied operation over parallel sequences of vectors.
+        Looking the handler up once keeps the per-sample cost down to a single call.
+
+        :type operation: Union[int, Operation]
+        :type a: Sequence[om.MVector]
+        :type b: Sequence[om.MVector]
+        :type weight: float
+        :rtype: List[Union[om.MVector, float]]
+        """
+
+        handler = cls.__handlers__[operation]
+        return [handler(x, y, weight) for (x, y) in zip(a, b)]
+    # endregion